@@ -2,10 +2,12 @@
 """
 Arduino Curriculum Generator for NovEng Platform
 Generates overview.md and lesson.md for all 50 Arduino modules
+and compiles each module's quiz.json into the indexed quiz pack
 """
 
 import os
 import json
+import hashlib
 
 # Module data structure
 MODULES = [
@@ -360,18 +362,161 @@ def create_module_files(module):
 
     print(f"[OK] Created module {module['id']}: {module['title']}")
 
+QUIZ_DIFFICULTIES = ("easy", "medium", "hard")
+QUIZ_QUESTION_KEYS = ("id", "question", "options", "correctAnswer", "explanation", "difficulty")
+QUIZ_OUTPUT_DIR = "quizzes"
+QUIZ_PACK_PREFIX = "quizzes."
+QUIZ_PACK_SUFFIX = ".jsonl"
+
+
+def validate_quiz(slug, quiz):
+    """Return a list of problems found in a module's quiz.json (empty if valid)"""
+    if not isinstance(quiz, dict):
+        return [f"{slug}: quiz must be a JSON object"]
+    questions = quiz.get("questions")
+    if not isinstance(questions, list) or not questions:
+        return [f"{slug}: quiz must have a non-empty 'questions' list"]
+
+    errors = []
+    seen_ids = set()
+    for index, question in enumerate(questions):
+        if not isinstance(question, dict):
+            errors.append(f"{slug}: question #{index + 1}: must be a JSON object")
+            continue
+
+        question_id = question.get("id")
+        if isinstance(question_id, int) and not isinstance(question_id, bool):
+            where = f"{slug}: question {question_id}"
+            if question_id in seen_ids:
+                errors.append(f"{where}: duplicate id")
+            seen_ids.add(question_id)
+        else:
+            where = f"{slug}: question #{index + 1}"
+            errors.append(f"{where}: 'id' must be an integer")
+
+        unknown_keys = sorted(key for key in question if key not in QUIZ_QUESTION_KEYS)
+        if unknown_keys:
+            errors.append(f"{where}: unknown keys {', '.join(unknown_keys)}")
+
+        for field in ("question", "explanation"):
+            if not isinstance(question.get(field), str) or not question[field].strip():
+                errors.append(f"{where}: '{field}' must be a non-empty string")
+
+        options = question.get("options")
+        correct_answer = question.get("correctAnswer")
+        if not isinstance(options, list) or len(options) < 2:
+            errors.append(f"{where}: needs at least 2 options")
+        elif not all(isinstance(option, str) and option.strip() for option in options):
+            errors.append(f"{where}: every option must be a non-empty string")
+        elif not isinstance(correct_answer, int) or isinstance(correct_answer, bool):
+            errors.append(f"{where}: correctAnswer must be an integer option index")
+        elif not 0 <= correct_answer < len(options):
+            errors.append(f"{where}: correctAnswer is not a valid option index")
+
+        if question.get("difficulty") not in QUIZ_DIFFICULTIES:
+            errors.append(f"{where}: difficulty must be one of {', '.join(QUIZ_DIFFICULTIES)}")
+
+    return errors
+
+
+def compile_quizzes(curriculum_path="curriculum/curriculum-data.json"):
+    """Compile every <slug>/quiz.json next to curriculum_path into one pack plus a slug index
+
+    Each module's quiz becomes one compact JSON line in quizzes.<sha8>.jsonl,
+    named by content hash so a cached index never points into a newer pack.
+    index.json maps slug -> byte offset/length within the pack, so the
+    frontend only fetches the quiz for the lesson being viewed.
+    """
+    curriculum_dir = os.path.dirname(curriculum_path) or "."
+    output_dir = os.path.join(curriculum_dir, QUIZ_OUTPUT_DIR)
+
+    with open(curriculum_path, 'r', encoding='utf-8') as f:
+        modules = json.load(f)['curriculum']['modules']
+    module_numbers = {module['slug']: module['id'] for module in modules}
+
+    errors = []
+    quiz_slugs = sorted(
+        entry for entry in os.listdir(curriculum_dir)
+        if os.path.isfile(os.path.join(curriculum_dir, entry, "quiz.json"))
+    )
+    for slug in quiz_slugs:
+        if slug not in module_numbers:
+            errors.append(f"{slug}: quiz.json has no matching module in {curriculum_path}")
+    for slug in module_numbers:
+        if slug not in quiz_slugs:
+            print(f"[WARN] Module {module_numbers[slug]}: {slug} has no quiz.json")
+
+    records = []
+    for slug in sorted((s for s in quiz_slugs if s in module_numbers), key=module_numbers.get):
+        with open(os.path.join(curriculum_dir, slug, "quiz.json"), 'r', encoding='utf-8') as f:
+            try:
+                quiz = json.load(f)
+            except json.JSONDecodeError as e:
+                errors.append(f"{slug}: invalid JSON ({e})")
+                continue
+        quiz_errors = validate_quiz(slug, quiz)
+        if quiz_errors:
+            errors.extend(quiz_errors)
+            continue
+        records.append({
+            "moduleSlug": slug,
+            "moduleNumber": module_numbers[slug],
+            "questions": quiz["questions"]
+        })
+
+    if errors:
+        raise ValueError("Invalid quiz sources:\n" + "\n".join(f"  - {e}" for e in errors))
+
+    index = {"pack": None, "modules": {}}
+    pack = bytearray()
+    for record in records:
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+        index["modules"][record["moduleSlug"]] = {
+            "moduleNumber": record["moduleNumber"],
+            "offset": len(pack),
+            "length": len(line),
+            "questionCount": len(record["questions"])
+        }
+        pack.extend(line)
+    pack_file = f"{QUIZ_PACK_PREFIX}{hashlib.sha256(pack).hexdigest()[:8]}{QUIZ_PACK_SUFFIX}"
+    index["pack"] = pack_file
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, pack_file), 'wb') as f:
+        f.write(pack)
+    with open(os.path.join(output_dir, "index.json"), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+        f.write("\n")
+
+    # Remove packs from previous builds so only the indexed one ships
+    for entry in os.listdir(output_dir):
+        if (entry.startswith(QUIZ_PACK_PREFIX) and entry.endswith(QUIZ_PACK_SUFFIX)
+                and entry != pack_file):
+            os.remove(os.path.join(output_dir, entry))
+
+    print(f"[OK] Compiled {len(records)} quizzes into {output_dir}/{pack_file} ({len(pack)} bytes)")
+    return index
+
 # Generate all modules
 if __name__ == "__main__":
     import sys
     sys.stdout.reconfigure(encoding='utf-8')
 
-    print("Generating Arduino Curriculum...")
-    print("=" * 50)
+    if "--quizzes-only" not in sys.argv:
+        print("Generating Arduino Curriculum...")
+        print("=" * 50)
+
+        for module in MODULES:
+            create_module_files(module)
 
-    for module in MODULES:
-        create_module_files(module)
+        print("=" * 50)
+        print(f"[OK] Generated {len(MODULES)} modules successfully!")
+        print("Note: Modules 1-3 were created manually with full content.")
+        print("Remaining modules created with structured templates.")
 
-    print("=" * 50)
-    print(f"[OK] Generated {len(MODULES)} modules successfully!")
-    print("Note: Modules 1-3 were created manually with full content.")
-    print("Remaining modules created with structured templates.")
+    print("Compiling module quizzes...")
+    try:
+        compile_quizzes()
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
@@ -258,6 +258,8 @@ export const ModuleDetail: React.FC = () => {
 
   // Fetch module data from backend
   useEffect(() => {
+    let active = true;
+
     async function loadModule() {
       if (!id) return;
 
@@ -265,14 +267,22 @@ export const ModuleDetail: React.FC = () => {
         setLoading(true);
         setError(null);
 
+        // Load quiz if available, alongside the lesson rather than ahead of it
+        setQuiz(null);
+        getQuizBySlug(id)
+          .catch((quizError) => {
+            console.warn(`⚠️ [ModuleDetail] Quiz unavailable for "${id}":`, quizError);
+            return null;
+          })
+          .then((moduleQuiz) => {
+            if (!active) return;
+            console.log(`🎯 [ModuleDetail] Loading quiz for "${id}":`, moduleQuiz);
+            setQuiz(moduleQuiz);
+          });
+
         const moduleData = await api.getModule(id);
         setModule(moduleData);
 
-        // Load quiz if available
-        const moduleQuiz = getQuizBySlug(id);
-        console.log(`🎯 [ModuleDetail] Loading quiz for "${id}":`, moduleQuiz);
-        setQuiz(moduleQuiz);
-
         console.log(`📖 [ModuleDetail] Fetching content for module: ${id}`);
         const content = await api.getModuleContent(id);
         console.log(`📊 [ModuleDetail] Received content:`, {
@@ -300,6 +310,10 @@ export const ModuleDetail: React.FC = () => {
     }
 
     loadModule();
+
+    return () => {
+      active = false;
+    };
   }, [id]);
 
   const handleSendMessage = async () => {